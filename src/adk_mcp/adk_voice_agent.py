@@ -1,12 +1,23 @@
 """Enhanced Google ADK Voice Agent with Runner.run_live() integration."""
 
 import asyncio
+import binascii
 import json
 import logging
+import struct
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, AsyncIterator, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable, Union
+from dataclasses import dataclass
+
+from aiohttp import WSMsgType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from google.adk.agents import LlmAgent
@@ -23,18 +34,88 @@ except ImportError:
 from .google_adk import GoogleADKWebAgent, ADKWebConfig
 from .voice_code_executor import VoiceCodeExecutor
 
+logger = logging.getLogger(__name__)
+
+# Tags for binary server -> client frames (first byte of the frame)
+FRAME_TAG_AUDIO_CHUNK_ACK = 0x01
+
+# Audio chunk ack: tag byte followed by the uint32 sequence number
+_ACK_FRAME = struct.Struct("<BI")
+MAX_SEQUENCE_NUMBER = 0xFFFFFFFF  # fits the uint32 in ack and audio frames
+
+# Header of binary client -> server audio frames: sequence number, sample rate,
+# capture timestamp in microseconds since the epoch (little-endian)
+_AUDIO_FRAME_HEADER = struct.Struct("<IIQ")
+AUDIO_FRAME_HEADER_SIZE = _AUDIO_FRAME_HEADER.size
+
+# Audio embedded in JSON messages is base64 (4/3 expansion instead of 2x for hex)
+_b2a = binascii.b2a_base64
+_a2b = binascii.a2b_base64
+
+# Encoder for outgoing JSON frames, built once instead of per json.dumps() call,
+# and decoder for incoming ones (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+if ORJSON_AVAILABLE:
+    def _encode_json(message: Dict[str, Any]) -> str:
+        return orjson.dumps(message).decode()
+    _decode_json = orjson.loads
+else:
+    _encode_json = json.JSONEncoder(separators=(",", ":")).encode
+    _decode_json = json.loads
+
+# Bounds for the history mirrored into ADK session state
+MAX_SESSION_EVENTS = 50
+MAX_SESSION_MESSAGES = 20
+
+# Most frames the outbound writer drains from its queue in one pass
+MAX_OUTBOUND_BATCH = 128
+# Frames a session may have waiting for the socket before the client counts as stalled
+MAX_OUTBOUND_QUEUE = 256
+
+# (epoch second, ISO 8601 string) of the last formatted timestamp
+_now_iso_cache = [0, ""]
+
 
-@dataclass
+def _now_iso() -> str:
+    """Current UTC time in ISO 8601, reformatted at most once per second."""
+    now = int(time.time())
+    if now != _now_iso_cache[0]:
+        _now_iso_cache[0] = now
+        _now_iso_cache[1] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _now_iso_cache[1]
+
+
+@dataclass(slots=True)
 class AudioChunk:
     """Represents an audio chunk for streaming."""
     data: bytes
-    timestamp: datetime
+    timestamp_us: int  # microseconds since the epoch
     sequence_number: int
     sample_rate: int = 16000
     channels: int = 1
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Capture time as a timezone-aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_us / 1_000_000, timezone.utc)
+    
+    def to_bytes(self) -> bytes:
+        """Encode as a binary WebSocket frame: fixed header followed by raw PCM."""
+        header = _AUDIO_FRAME_HEADER.pack(self.sequence_number, self.sample_rate, self.timestamp_us)
+        return header + self.data
+    
+    @classmethod
+    def from_bytes(cls, frame: bytes) -> "AudioChunk":
+        """Decode a binary WebSocket frame produced by to_bytes()."""
+        sequence_number, sample_rate, timestamp_us = _AUDIO_FRAME_HEADER.unpack_from(frame)
+        return cls(
+            data=frame[AUDIO_FRAME_HEADER_SIZE:],
+            timestamp_us=timestamp_us,
+            sequence_number=sequence_number,
+            sample_rate=sample_rate
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceMessage:
     """Voice message in conversation history."""
     role: str  # "user" or "assistant"
@@ -58,12 +139,80 @@ class ConversationContext:
         self.adk_session = None
         self.is_speaking = False
         self.is_listening = False
-        self.last_activity = datetime.now(timezone.utc)
+        self.last_activity = time.time()
         self.conversation_history: List[VoiceMessage] = []
         self.sequence_number = 0
         self.runner = None
         self.live_session = None
         
+        # Outbound frames are sent by a dedicated writer task so the reader never blocks on send
+        self.outbound: asyncio.Queue = asyncio.Queue(maxsize=MAX_OUTBOUND_QUEUE)
+        self.writer_task: Optional[asyncio.Task] = None
+        self.outbound_closed = False
+        self._close_task: Optional[asyncio.Task] = None
+        
+    def start_writer(self):
+        """Start the task that sends queued frames to the WebSocket."""
+        if self.writer_task is None:
+            self.writer_task = asyncio.create_task(self._write_outbound())
+            self.writer_task.add_done_callback(self._on_writer_done)
+    
+    def send(self, frame: Union[str, bytes]):
+        """Queue a text (str) or binary (bytes) frame for the writer task.
+        
+        Frames are discarded once the writer has stopped. A client that falls
+        MAX_OUTBOUND_QUEUE frames behind is disconnected rather than buffered.
+        """
+        if self.outbound_closed:
+            return
+        try:
+            self.outbound.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning(f"Outbound queue full for session {self.session_id}, closing")
+            self._close_outbound()
+    
+    def _close_outbound(self):
+        """Stop accepting frames and close the socket, which ends the session."""
+        self.outbound_closed = True
+        if self.writer_task is not None:
+            self.writer_task.cancel()
+        # Keep a reference so the close task is not garbage-collected mid-flight
+        if self._close_task is None:
+            self._close_task = asyncio.ensure_future(self.websocket.close())
+    
+    def _on_writer_done(self, task: asyncio.Task):
+        """Close the session's socket if the writer died on a send error."""
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error(f"Outbound writer failed for session {self.session_id}: {task.exception()}")
+        self._close_outbound()
+    
+    async def _write_outbound(self):
+        """Drain queued frames in batches and send them in order."""
+        while True:
+            batch = [await self.outbound.get()]
+            while len(batch) < MAX_OUTBOUND_BATCH and not self.outbound.empty():
+                batch.append(self.outbound.get_nowait())
+            
+            for frame in batch:
+                if isinstance(frame, bytes):
+                    await self.websocket.send_bytes(frame)
+                else:
+                    await self.websocket.send_str(frame)
+    
+    async def stop_writer(self):
+        """Cancel the writer task; frames still queued are dropped."""
+        self.outbound_closed = True
+        if self.writer_task is not None:
+            self.writer_task.cancel()
+            try:
+                await self.writer_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass  # already reported by _on_writer_done
+            self.writer_task = None
+        
     async def initialize_adk_session(self, session_service: SessionService):
         """Initialize ADK session for persistent context."""
         if ADK_AVAILABLE:
@@ -76,33 +225,40 @@ class ConversationContext:
         """Log event to session for debugging and context."""
         event = {
             "type": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "data": data
         }
         
         if self.adk_session and ADK_AVAILABLE:
-            # Store events in session state
-            events = self.adk_session.state.get("events", [])
+            # Store events in session state, keeping the last MAX_SESSION_EVENTS in place
+            events = self.adk_session.state.setdefault("events", [])
             events.append(event)
-            self.adk_session.state["events"] = events[-50]  # Keep last 50 events
+            if len(events) > MAX_SESSION_EVENTS:
+                del events[:-MAX_SESSION_EVENTS]
     
-    async def add_message(self, message: VoiceMessage):
+    def add_message(self, message: VoiceMessage):
         """Add message to conversation history."""
         self.conversation_history.append(message)
-        self.last_activity = datetime.now(timezone.utc)
+        self.last_activity = time.time()
         
         # Store in ADK session state
         if self.adk_session and ADK_AVAILABLE:
-            messages = self.adk_session.state.get("conversation_history", [])
+            messages = self.adk_session.state.setdefault("conversation_history", [])
             messages.append({
                 "role": message.role,
                 "content": message.content,
                 "timestamp": message.timestamp.isoformat(),
                 "message_type": message.message_type
             })
-            self.adk_session.state["conversation_history"] = messages[-20]  # Keep last 20 messages
+            if len(messages) > MAX_SESSION_MESSAGES:
+                del messages[:-MAX_SESSION_MESSAGES]
+    
+    def ingest(self, sequence_number: int):
+        """Record an incoming audio chunk: refresh activity and track its sequence number."""
+        self.last_activity = time.time()
+        self.sequence_number = sequence_number
     
-    async def get_next_sequence_number(self) -> int:
+    def get_next_sequence_number(self) -> int:
         """Get next sequence number for audio chunks."""
         self.sequence_number += 1
         return self.sequence_number
@@ -112,7 +268,7 @@ class VoiceCodeExecutionTool:
     """Voice-aware code execution tool using ADK BuiltInCodeExecutor."""
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         if ADK_AVAILABLE:
             self.code_executor = BuiltInCodeExecutor()
         else:
@@ -181,7 +337,7 @@ class ADKLiveRunner:
     
     def __init__(self, config: ADKWebConfig):
         self.config = config
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.session_service = InMemorySessionService() if ADK_AVAILABLE else None
         self.artifact_service = InMemoryArtifactService() if ADK_AVAILABLE else None
         
@@ -262,14 +418,14 @@ class ADKLiveRunner:
             await session.log_event("live_session_error", {"error": str(e)})
             return False
     
-    async def process_audio_chunk(self, session: ADKVoiceSession, audio_chunk: AudioChunk) -> Optional[str]:
-        """Process audio chunk through ADK LiveRequestQueue."""
+    async def process_audio_chunk(self, session: ADKVoiceSession, audio_data: bytes) -> Optional[str]:
+        """Process raw PCM audio through ADK LiveRequestQueue."""
         if not session.live_session:
             return None
         
         try:
             # Send audio to LiveRequestQueue
-            await session.live_session.send_audio(audio_chunk.data)
+            await session.live_session.send_audio(audio_data)
             
             # Check for transcription
             transcription = await session.live_session.get_transcription()
@@ -277,16 +433,16 @@ class ADKLiveRunner:
             if transcription:
                 await session.log_event("transcription_received", {
                     "transcription": transcription,
-                    "audio_size": len(audio_chunk.data)
+                    "audio_size": len(audio_data)
                 })
                 
                 # Add to conversation history
                 voice_message = VoiceMessage(
                     role="user",
                     content=transcription,
-                    audio_data=audio_chunk.data
+                    audio_data=audio_data
                 )
-                await session.add_message(voice_message)
+                session.add_message(voice_message)
             
             return transcription
             
@@ -308,7 +464,7 @@ class ADKLiveRunner:
                 role="assistant",
                 content=response.text if hasattr(response, 'text') else str(response)
             )
-            await session.add_message(voice_message)
+            session.add_message(voice_message)
             
             # Stream audio response
             if hasattr(response, 'audio_stream'):
@@ -334,7 +490,7 @@ class ADKLiveRunner:
             session.is_speaking = False
             
             await session.log_event("interruption_handled", {
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             })
             
         except Exception as e:
@@ -370,7 +526,7 @@ class GoogleADKVoiceAgent:
     
     def __init__(self, config: ADKWebConfig):
         self.config = config
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.active_sessions: Dict[str, ADKVoiceSession] = {}
         
         # Initialize ADK Live Runner
@@ -378,6 +534,14 @@ class GoogleADKVoiceAgent:
         
         # Voice code executor for fallback
         self.voice_code_executor = VoiceCodeExecutor() if hasattr(self, 'VoiceCodeExecutor') else None
+        
+        # JSON message handlers keyed by message type, called as handler(data, session, websocket)
+        self._message_handlers: Dict[str, Callable] = {
+            "audio_chunk": self._handle_audio_chunk,
+            "start_listening": lambda data, session, websocket: self._handle_start_listening(session, websocket),
+            "stop_listening": lambda data, session, websocket: self._handle_stop_listening(session, websocket),
+            "interruption": lambda data, session, websocket: self._handle_interruption(session, websocket),
+        }
     
     async def initialize(self):
         """Initialize the voice agent."""
@@ -398,6 +562,7 @@ class GoogleADKVoiceAgent:
         """Create new ADK voice session."""
         session_id = str(uuid.uuid4())
         session = ADKVoiceSession(session_id, websocket, user_id)
+        session.start_writer()
         
         # Start ADK live session
         success = await self.live_runner.start_live_session(session)
@@ -416,15 +581,26 @@ class GoogleADKVoiceAgent:
             start_message = {
                 "type": "session_started",
                 "session_id": session.session_id,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
-            await websocket.send(json.dumps(start_message))
+            session.send(_encode_json(start_message))
             
             # Handle incoming messages
             async for message in websocket:
-                if message.type == 'text':
+                if message.type == WSMsgType.BINARY:
+                    # Binary frames carry raw audio, see AudioChunk.to_bytes(); only the
+                    # sequence number is needed, so skip building an AudioChunk
+                    frame = message.data
+                    if len(frame) < AUDIO_FRAME_HEADER_SIZE:
+                        self.logger.warning(f"Dropping truncated audio frame ({len(frame)} bytes)")
+                        continue
+                    sequence_number = _AUDIO_FRAME_HEADER.unpack_from(frame)[0]
+                    await self._process_audio_chunk(
+                        frame[AUDIO_FRAME_HEADER_SIZE:], sequence_number, session, websocket
+                    )
+                elif message.type == WSMsgType.TEXT:
                     await self._handle_websocket_message(message.data, session, websocket)
-                elif message.type == 'error':
+                elif message.type == WSMsgType.ERROR:
                     self.logger.error(f"WebSocket error: {message.data}")
                     break
                     
@@ -436,19 +612,15 @@ class GoogleADKVoiceAgent:
     async def _handle_websocket_message(self, message_data: str, session: ADKVoiceSession, websocket):
         """Handle individual WebSocket message."""
         try:
-            data = json.loads(message_data)
+            data = _decode_json(message_data)
             message_type = data.get("type")
             
-            if message_type == "audio_chunk":
-                await self._handle_audio_chunk(data, session, websocket)
-            elif message_type == "start_listening":
-                await self._handle_start_listening(session, websocket)
-            elif message_type == "stop_listening":
-                await self._handle_stop_listening(session, websocket)
-            elif message_type == "interruption":
-                await self._handle_interruption(session, websocket)
-            else:
+            handler = self._message_handlers.get(message_type)
+            if handler is None:
                 self.logger.warning(f"Unknown message type: {message_type}")
+                return
+            
+            await handler(data, session, websocket)
                 
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in WebSocket message: {e}")
@@ -456,31 +628,34 @@ class GoogleADKVoiceAgent:
             self.logger.error(f"Error handling WebSocket message: {e}")
     
     async def _handle_audio_chunk(self, data: Dict[str, Any], session: ADKVoiceSession, websocket):
-        """Handle incoming audio chunk."""
+        """Handle incoming audio chunk sent as a JSON message."""
         try:
             # Extract audio data
-            audio_hex = data.get("audio_data", "")
-            audio_bytes = bytes.fromhex(audio_hex)
+            audio_bytes = _a2b(data.get("audio_b64", ""))
             sequence_number = data.get("sequence_number", 0)
+            if (not isinstance(sequence_number, int) or isinstance(sequence_number, bool)
+                    or not 0 <= sequence_number <= MAX_SEQUENCE_NUMBER):
+                self.logger.warning(f"Dropping audio chunk with invalid sequence number: {sequence_number!r}")
+                return
             
-            # Create audio chunk
-            audio_chunk = AudioChunk(
-                data=audio_bytes,
-                timestamp=datetime.now(timezone.utc),
-                sequence_number=sequence_number
-            )
+            await self._process_audio_chunk(audio_bytes, sequence_number, session, websocket)
+            
+        except Exception as e:
+            self.logger.error(f"Error handling audio chunk: {e}")
+    
+    async def _process_audio_chunk(self, audio_data: bytes, sequence_number: int, session: ADKVoiceSession, websocket):
+        """Forward an audio chunk to the live session, acknowledge it and respond to transcriptions."""
+        try:
+            session.ingest(sequence_number)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processed audio chunk for session %s: %d bytes, seq %d",
+                             session.session_id, len(audio_data), sequence_number)
             
             # Process through ADK LiveRequestQueue
-            transcription = await self.live_runner.process_audio_chunk(session, audio_chunk)
+            transcription = await self.live_runner.process_audio_chunk(session, audio_data)
             
-            # Send acknowledgment
-            ack_message = {
-                "type": "audio_chunk_ack",
-                "session_id": session.session_id,
-                "sequence_number": sequence_number,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            await websocket.send(json.dumps(ack_message))
+            # Send acknowledgment as a compact binary frame
+            session.send(_ACK_FRAME.pack(FRAME_TAG_AUDIO_CHUNK_ACK, sequence_number))
             
             # If we got a transcription, generate response
             if transcription:
@@ -488,7 +663,7 @@ class GoogleADKVoiceAgent:
                 await self._generate_and_send_response(transcription, session, websocket)
             
         except Exception as e:
-            self.logger.error(f"Error handling audio chunk: {e}")
+            self.logger.error(f"Error processing audio chunk: {e}")
     
     async def _send_transcription(self, transcription: str, session: ADKVoiceSession, websocket):
         """Send transcription to client."""
@@ -496,9 +671,9 @@ class GoogleADKVoiceAgent:
             "type": "transcription",
             "text": transcription,
             "session_id": session.session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         }
-        await websocket.send(json.dumps(transcription_message))
+        session.send(_encode_json(transcription_message))
     
     async def _generate_and_send_response(self, text: str, session: ADKVoiceSession, websocket):
         """Generate and send voice response."""
@@ -523,11 +698,11 @@ class GoogleADKVoiceAgent:
             response_message = {
                 "type": "response",
                 "text": response_text,
-                "audio_data": b''.join(audio_chunks).hex() if audio_chunks else None,
+                "audio_b64": _b2a(b''.join(audio_chunks), newline=False).decode("ascii") if audio_chunks else None,
                 "session_id": session.session_id,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
-            await websocket.send(json.dumps(response_message))
+            session.send(_encode_json(response_message))
             
             session.is_speaking = False
             
@@ -542,9 +717,9 @@ class GoogleADKVoiceAgent:
         response = {
             "type": "listening_started",
             "session_id": session.session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         }
-        await websocket.send(json.dumps(response))
+        session.send(_encode_json(response))
     
     async def _handle_stop_listening(self, session: ADKVoiceSession, websocket):
         """Handle stop listening request."""
@@ -553,9 +728,9 @@ class GoogleADKVoiceAgent:
         response = {
             "type": "listening_stopped",
             "session_id": session.session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         }
-        await websocket.send(json.dumps(response))
+        session.send(_encode_json(response))
     
     async def _handle_interruption(self, session: ADKVoiceSession, websocket):
         """Handle voice interruption."""
@@ -564,9 +739,9 @@ class GoogleADKVoiceAgent:
         response = {
             "type": "interruption_handled",
             "session_id": session.session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         }
-        await websocket.send(json.dumps(response))
+        session.send(_encode_json(response))
     
     async def close_voice_session(self, session: ADKVoiceSession):
         """Close voice session and cleanup resources."""
@@ -575,6 +750,9 @@ class GoogleADKVoiceAgent:
         # Close ADK live session
         await self.live_runner.close_live_session(session)
         
+        # Stop sending queued frames
+        await session.stop_writer()
+        
         # Cleanup resources
         if session_id in self.active_sessions:
             del self.active_sessions[session_id]
@@ -593,7 +771,7 @@ class GoogleADKVoiceAgent:
                     "is_speaking": session.is_speaking,
                     "is_listening": session.is_listening,
                     "conversation_length": len(session.conversation_history),
-                    "last_activity": session.last_activity.isoformat()
+                    "last_activity": datetime.fromtimestamp(session.last_activity, timezone.utc).isoformat()
                 }
                 for session in self.active_sessions.values()
             ]
@@ -186,12 +186,30 @@ class AndroidWebViewBridge:
                 const sendButton = document.getElementById('sendButton');
                 const statusDiv = document.getElementById('status');
                 
+                // Auto-scroll only while the user is at the bottom, at most once per frame
+                let followMessages = true;
+                let scrollPending = false;
+                messagesDiv.addEventListener('scroll', function() {{
+                    followMessages = messagesDiv.scrollTop + messagesDiv.clientHeight >= messagesDiv.scrollHeight - 20;
+                }}, {{ passive: true }});
+                
+                function pinScroll() {{
+                    if (scrollPending) return;
+                    scrollPending = true;
+                    requestAnimationFrame(function() {{
+                        scrollPending = false;
+                        if (followMessages) {{
+                            messagesDiv.scrollTop = messagesDiv.scrollHeight;
+                        }}
+                    }});
+                }}
+                
                 function addMessage(content, isSent) {{
                     const messageDiv = document.createElement('div');
                     messageDiv.className = 'message ' + (isSent ? 'sent' : 'received');
                     messageDiv.textContent = content;
                     messagesDiv.appendChild(messageDiv);
-                    messagesDiv.scrollTop = messagesDiv.scrollHeight;
+                    pinScroll();
                 }}
                 
                 function sendMessage() {{
@@ -1,8 +1,11 @@
 """Server implementation for ADK-MCP with bidirectional streaming."""
 
 import asyncio
+import gzip
 import json
-from typing import Optional, Dict, Any
+import socket
+import sys
+from typing import Optional, Dict, Any, Tuple
 from aiohttp import web
 import websockets
 from websockets.server import WebSocketServerProtocol
@@ -16,6 +19,27 @@ try:
 except ImportError:
     ANDROID_WEBVIEW_AVAILABLE = False
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Linux busy polling; the socket module does not export this constant
+SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+BUSY_POLL_AVAILABLE = sys.platform.startswith("linux")
+
+
+def _compact_html(html: str) -> str:
+    """Strip indentation and blank lines from an inline HTML template."""
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def _build_page(html: str) -> Tuple[bytes, bytes]:
+    """Compact an HTML page and encode it once, both plain and gzip-compressed."""
+    body = _compact_html(html).encode("utf-8")
+    return body, gzip.compress(body)
+
 
 class ADKServer:
     """Main server for ADK-MCP with bidirectional streaming support."""
@@ -27,6 +51,7 @@ class ADKServer:
         websocket_port: int = 8081,
         enable_google_adk: bool = True,
         adk_config: Optional[ADKWebConfig] = None,
+        voice_busy_poll_us: int = 0,
     ):
         """
         Initialize ADK server.
@@ -37,10 +62,13 @@ class ADKServer:
             websocket_port: WebSocket server port
             enable_google_adk: Enable Google ADK integration
             adk_config: Google ADK configuration (uses env vars if None)
+            voice_busy_poll_us: SO_BUSY_POLL budget in microseconds for voice
+                sockets (Linux only, 0 disables)
         """
         self.host = host
         self.port = port
         self.websocket_port = websocket_port
+        self.voice_busy_poll_us = voice_busy_poll_us if BUSY_POLL_AVAILABLE else 0
         self.app = web.Application()
         self.setup_routes()
         
@@ -58,6 +86,10 @@ class ADKServer:
         # Active voice sessions (managed by ADK)
         self.active_voice_sessions = {}
         
+        # Rendered HTML pages as (plain, gzipped) bytes, built on first request
+        self._index_page: Optional[Tuple[bytes, bytes]] = None
+        self._webview_page: Optional[Tuple[bytes, bytes]] = None
+        
     def setup_routes(self):
         """Setup HTTP routes."""
         self.app.router.add_get("/", self.handle_index)
@@ -79,7 +111,23 @@ class ADKServer:
     
     async def handle_index(self, request: web.Request) -> web.Response:
         """Handle index page."""
-        html = f"""
+        if self._index_page is None:
+            self._index_page = _build_page(self._render_index())
+        
+        return self._page_response(request, self._index_page)
+    
+    def _page_response(self, request: web.Request, page: Tuple[bytes, bytes]) -> web.Response:
+        """Serve a cached page, sending the pre-gzipped copy when the client accepts it."""
+        body, gzipped = page
+        headers = {"Vary": "Accept-Encoding"}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzipped
+            headers["Content-Encoding"] = "gzip"
+        return web.Response(body=body, content_type="text/html", charset="utf-8", headers=headers)
+    
+    def _render_index(self) -> str:
+        """Render the index page template."""
+        return f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -154,7 +202,6 @@ class ADKServer:
         </body>
         </html>
         """
-        return web.Response(text=html, content_type="text/html")
     
     async def handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
@@ -174,8 +221,10 @@ class ADKServer:
         if not ANDROID_WEBVIEW_AVAILABLE:
             return web.Response(text="Android WebView not available", status=404)
         
-        html = self.webview_bridge.get_html_template()
-        return web.Response(text=html, content_type="text/html")
+        if self._webview_page is None:
+            self._webview_page = _build_page(self.webview_bridge.get_html_template())
+        
+        return self._page_response(request, self._webview_page)
     
 
     
@@ -259,10 +308,25 @@ class ADKServer:
                 status=500
             )
     
+    def _enable_busy_poll(self, request: web.Request):
+        """Let the kernel busy-poll the voice socket to cut receive latency."""
+        sock = request.transport.get_extra_info("socket") if request.transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, self.voice_busy_poll_us)
+        except OSError as e:
+            # Needs CAP_NET_ADMIN on some kernels; stop trying after the first refusal
+            print(f"SO_BUSY_POLL unavailable, disabling: {e}")
+            self.voice_busy_poll_us = 0
+    
     async def handle_voice_stream(self, request: web.Request) -> web.WebSocketResponse:
         """Handle voice streaming WebSocket connection."""
-        ws = web.WebSocketResponse()
+        # PCM audio does not compress; skip permessage-deflate on every frame
+        ws = web.WebSocketResponse(compress=False)
         await ws.prepare(request)
+        if self.voice_busy_poll_us:
+            self._enable_busy_poll(request)
         
         # Create voice session using ADK
         if self.google_adk_voice_agent:
@@ -333,8 +397,11 @@ class ADKServer:
         await asyncio.Future()  # Run forever
     
     def run(self):
-        """Run the server (blocking)."""
-        asyncio.run(self.start())
+        """Run the server (blocking), on uvloop when it is installed."""
+        if UVLOOP_AVAILABLE:
+            asyncio.run(self.start(), loop_factory=uvloop.new_event_loop)
+        else:
+            asyncio.run(self.start())
 
 
 def main():
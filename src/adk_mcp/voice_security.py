@@ -69,35 +69,45 @@ class ExecutionLimits:
 class CodeSecurityAnalyzer:
     """Analyzes code for security vulnerabilities."""
     
+    # Dangerous patterns and their security levels
+    DANGEROUS_PATTERNS = {
+        # Critical security risks
+        r'\b(exec|eval)\s*\(': (SecurityLevel.CRITICAL, "Dynamic code execution", "Avoid using exec() or eval()"),
+        r'\b__import__\s*\(': (SecurityLevel.CRITICAL, "Dynamic imports", "Use standard import statements"),
+        r'\bcompile\s*\(': (SecurityLevel.CRITICAL, "Code compilation", "Avoid compiling code at runtime"),
+        r'\bgetattr\s*\([^,]+,\s*["\'][^"\']*__[^"\']*["\']': (SecurityLevel.CRITICAL, "Accessing private attributes", "Avoid accessing private/magic methods"),
+        
+        # High security risks
+        r'\bos\.system\s*\(': (SecurityLevel.HIGH, "System command execution", "Use subprocess with specific commands"),
+        r'\bsubprocess\.(call|run|Popen)': (SecurityLevel.HIGH, "Subprocess execution", "Be careful with subprocess calls"),
+        r'\bopen\s*\([^)]*["\'][^"\']*\.\.[^"\']*["\']': (SecurityLevel.HIGH, "Path traversal", "Avoid using .. in file paths"),
+        r'\bpickle\.(loads?|dumps?)\s*\(': (SecurityLevel.HIGH, "Pickle serialization", "Pickle can execute arbitrary code"),
+        r'\b(input|raw_input)\s*\(': (SecurityLevel.HIGH, "User input", "Be careful with user input in voice context"),
+        
+        # Medium security risks
+        r'\bimport\s+(os|sys|subprocess|socket|urllib|requests)': (SecurityLevel.MEDIUM, "Potentially dangerous import", "Review if this import is necessary"),
+        r'\bfile\s*\(': (SecurityLevel.MEDIUM, "File operations", "Use open() instead of file()"),
+        r'\bglobals\s*\(\)': (SecurityLevel.MEDIUM, "Global namespace access", "Avoid modifying global namespace"),
+        r'\blocals\s*\(\)': (SecurityLevel.MEDIUM, "Local namespace access", "Be careful with namespace manipulation"),
+        
+        # Low security risks
+        r'\bdel\s+': (SecurityLevel.LOW, "Variable deletion", "Consider if deletion is necessary"),
+        r'\b(exit|quit)\s*\(': (SecurityLevel.LOW, "Program termination", "Avoid terminating the program"),
+    }
+    
+    # Compiled once per process and shared by every analyzer instance
+    _COMPILED_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE | re.MULTILINE), details)
+        for pattern, details in DANGEROUS_PATTERNS.items()
+    ]
+    _IMPORT_PATTERNS = [
+        re.compile(r'^\s*import\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)', re.IGNORECASE),
+        re.compile(r'^\s*from\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s+import', re.IGNORECASE),
+    ]
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Dangerous patterns and their security levels
-        self.dangerous_patterns = {
-            # Critical security risks
-            r'\b(exec|eval)\s*\(': (SecurityLevel.CRITICAL, "Dynamic code execution", "Avoid using exec() or eval()"),
-            r'\b__import__\s*\(': (SecurityLevel.CRITICAL, "Dynamic imports", "Use standard import statements"),
-            r'\bcompile\s*\(': (SecurityLevel.CRITICAL, "Code compilation", "Avoid compiling code at runtime"),
-            r'\bgetattr\s*\([^,]+,\s*["\'][^"\']*__[^"\']*["\']': (SecurityLevel.CRITICAL, "Accessing private attributes", "Avoid accessing private/magic methods"),
-            
-            # High security risks
-            r'\bos\.system\s*\(': (SecurityLevel.HIGH, "System command execution", "Use subprocess with specific commands"),
-            r'\bsubprocess\.(call|run|Popen)': (SecurityLevel.HIGH, "Subprocess execution", "Be careful with subprocess calls"),
-            r'\bopen\s*\([^)]*["\'][^"\']*\.\.[^"\']*["\']': (SecurityLevel.HIGH, "Path traversal", "Avoid using .. in file paths"),
-            r'\bpickle\.(loads?|dumps?)\s*\(': (SecurityLevel.HIGH, "Pickle serialization", "Pickle can execute arbitrary code"),
-            r'\b(input|raw_input)\s*\(': (SecurityLevel.HIGH, "User input", "Be careful with user input in voice context"),
-            
-            # Medium security risks
-            r'\bimport\s+(os|sys|subprocess|socket|urllib|requests)': (SecurityLevel.MEDIUM, "Potentially dangerous import", "Review if this import is necessary"),
-            r'\bfile\s*\(': (SecurityLevel.MEDIUM, "File operations", "Use open() instead of file()"),
-            r'\bglobals\s*\(\)': (SecurityLevel.MEDIUM, "Global namespace access", "Avoid modifying global namespace"),
-            r'\blocals\s*\(\)': (SecurityLevel.MEDIUM, "Local namespace access", "Be careful with namespace manipulation"),
-            
-            # Low security risks
-            r'\bdel\s+': (SecurityLevel.LOW, "Variable deletion", "Consider if deletion is necessary"),
-            r'\b(exit|quit)\s*\(': (SecurityLevel.LOW, "Program termination", "Avoid terminating the program"),
-        }
-        
         # Blocked imports (complete blacklist)
         self.blocked_imports = {
             'os', 'sys', 'subprocess', 'socket', 'urllib', 'urllib2', 'urllib3',
@@ -184,8 +194,8 @@ class CodeSecurityAnalyzer:
         violations = []
         lines = code.split('\n')
         
-        for pattern, (severity, description, suggestion) in self.dangerous_patterns.items():
-            matches = re.finditer(pattern, code, re.IGNORECASE | re.MULTILINE)
+        for pattern, (severity, description, suggestion) in self._COMPILED_PATTERNS:
+            matches = pattern.finditer(code)
             
             for match in matches:
                 # Find line number
@@ -207,16 +217,10 @@ class CodeSecurityAnalyzer:
         """Analyze import statements for security issues."""
         violations = []
         
-        # Find all import statements
-        import_patterns = [
-            r'^\s*import\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)',
-            r'^\s*from\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s+import'
-        ]
-        
         lines = code.split('\n')
         for line_num, line in enumerate(lines, 1):
-            for pattern in import_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in self._IMPORT_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     module_name = match.group(1).split('.')[0]  # Get root module
                     
@@ -9,7 +9,9 @@ from src.adk_mcp.server import ADKServer
 
 def main():
     """Start the ADK-MCP server with voice capabilities."""
-    # Use different ports to avoid conflicts
+    # Use different ports to avoid conflicts.
+    # Voice audio is streamed uncompressed: /voice/stream disables
+    # permessage-deflate because raw PCM frames do not compress.
     server = ADKServer(
         host="0.0.0.0",
         port=8000,  # HTTP server port
@@ -3,6 +3,19 @@
  * Handles voice interaction, WebSocket communication, and audio processing
  */
 
+// Tags for binary server frames (first byte of the frame)
+const FRAME_TAG_AUDIO_CHUNK_ACK = 0x01;
+
+// Size of the header on binary audio frames sent to the server
+const AUDIO_FRAME_HEADER_SIZE = 16;
+
+// Shared formatter; toLocaleTimeString() builds a new one on every call
+const MESSAGE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+    hour: '2-digit',
+    minute: '2-digit',
+    second: '2-digit'
+});
+
 class VoiceClient {
     constructor() {
         this.websocket = null;
@@ -43,6 +56,7 @@ class VoiceClient {
         
         // Conversation
         this.conversationArea = document.getElementById('conversationArea');
+        this.audioBarsContainer = document.getElementById('audioBars');
         
         // Code execution
         this.codeEditor = document.getElementById('codeEditor');
@@ -89,6 +103,13 @@ class VoiceClient {
             }
         });
         
+        // Only auto-scroll the conversation while the user is at the bottom
+        this.followConversation = true;
+        this.conversationArea.addEventListener('scroll', () => {
+            const area = this.conversationArea;
+            this.followConversation = area.scrollTop + area.clientHeight >= area.scrollHeight - 20;
+        }, { passive: true });
+        
         // Window events
         window.addEventListener('beforeunload', () => {
             this.cleanup();
@@ -96,17 +117,18 @@ class VoiceClient {
     }
     
     initializeAudioVisualizer() {
-        const audioBars = document.getElementById('audioBars');
-        
         // Create audio visualization bars
+        const bars = [];
         for (let i = 0; i < 20; i++) {
             const bar = document.createElement('div');
             bar.className = 'audio-bar';
             bar.style.height = '5px';
-            audioBars.appendChild(bar);
+            this.audioBarsContainer.appendChild(bar);
+            bars.push(bar);
         }
         
-        this.audioBars = audioBars.children;
+        // Plain array rather than the live HTMLCollection; read on every audio frame
+        this.audioBars = bars;
     }
     
     checkBrowserSupport() {
@@ -223,6 +245,7 @@ class VoiceClient {
         return new Promise((resolve, reject) => {
             const wsUrl = `ws://${window.location.host}/voice/stream`;
             this.websocket = new WebSocket(wsUrl);
+            this.websocket.binaryType = 'arraybuffer';
             
             this.websocket.onopen = () => {
                 this.isConnected = true;
@@ -331,17 +354,33 @@ class VoiceClient {
     sendAudioChunk(audioData) {
         if (!this.websocket || this.websocket.readyState !== WebSocket.OPEN) return;
         
-        const message = {
-            type: 'audio_chunk',
-            audio_data: this.arrayBufferToHex(audioData),
-            sequence_number: this.sequenceNumber++,
-            timestamp: new Date().toISOString()
-        };
+        // The AudioWorklet posts {type, data, ...}; the PCM is in data
+        if (audioData && audioData.type === 'audioData') {
+            audioData = audioData.data;
+        }
+        
+        // Binary frame: header (uint32 sequence number, uint32 sample rate,
+        // uint64 timestamp in microseconds, little-endian) followed by raw PCM
+        const pcm = ArrayBuffer.isView(audioData)
+            ? new Uint8Array(audioData.buffer, audioData.byteOffset, audioData.byteLength)
+            : new Uint8Array(audioData);
+        const frame = new Uint8Array(AUDIO_FRAME_HEADER_SIZE + pcm.byteLength);
+        const header = new DataView(frame.buffer);
+        header.setUint32(0, this.sequenceNumber++, true);
+        header.setUint32(4, this.audioContext.sampleRate, true);
+        header.setBigUint64(8, BigInt(Date.now()) * 1000n, true);
+        frame.set(pcm, AUDIO_FRAME_HEADER_SIZE);
         
-        this.websocket.send(JSON.stringify(message));
+        this.websocket.send(frame.buffer);
     }
     
     handleWebSocketMessage(event) {
+        // Binary frames are dispatched on their tag byte without touching the JSON parser
+        if (typeof event.data !== 'string') {
+            this.handleBinaryFrame(event.data);
+            return;
+        }
+        
         try {
             const data = JSON.parse(event.data);
             
@@ -357,15 +396,11 @@ class VoiceClient {
                     
                 case 'response':
                     this.addMessage('assistant', data.text);
-                    if (data.audio_data) {
-                        this.playAudioResponse(data.audio_data);
+                    if (data.audio_b64) {
+                        this.playAudioResponse(data.audio_b64);
                     }
                     break;
                     
-                case 'audio_chunk_ack':
-                    // Audio chunk acknowledged
-                    break;
-                    
                 case 'listening_started':
                     this.updateStatus('listening', 'Listening...');
                     break;
@@ -391,6 +426,19 @@ class VoiceClient {
         }
     }
     
+    handleBinaryFrame(buffer) {
+        const view = new DataView(buffer);
+        
+        switch (view.getUint8(0)) {
+            case FRAME_TAG_AUDIO_CHUNK_ACK:
+                this.lastAckedSequence = view.getUint32(1, true);
+                break;
+                
+            default:
+                console.log('Unknown binary frame tag:', view.getUint8(0));
+        }
+    }
+    
     async executeCode() {
         const code = this.codeEditor.value.trim();
         if (!code) {
@@ -398,37 +446,45 @@ class VoiceClient {
             return;
         }
         
-        try {
-            this.executeBtn.disabled = true;
-            this.executeBtn.textContent = 'Executing...';
-            
-            const response = await fetch('/execute', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ code })
-            });
-            
-            const result = await response.json();
-            
-            if (result.success) {
-                this.codeOutput.textContent = result.output || '(No output)';
-                this.showSuccess('Code executed successfully');
-            } else {
-                this.codeOutput.textContent = `Error: ${result.error}`;
-                this.showError('Code execution failed');
+        await this.withLoadingButton(this.executeBtn, 'Executing...', 'Execute Code', async () => {
+            try {
+                const response = await fetch('/execute', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({ code })
+                });
+                
+                const result = await response.json();
+                
+                if (result.success) {
+                    this.codeOutput.textContent = result.output || '(No output)';
+                    this.showSuccess('Code executed successfully');
+                } else {
+                    this.codeOutput.textContent = `Error: ${result.error}`;
+                    this.showError('Code execution failed');
+                }
+                
+                this.stats.executionsCount++;
+                this.updateStats();
+                
+            } catch (error) {
+                this.codeOutput.textContent = `Network Error: ${error.message}`;
+                this.showError('Failed to execute code');
             }
-            
-            this.stats.executionsCount++;
-            this.updateStats();
-            
-        } catch (error) {
-            this.codeOutput.textContent = `Network Error: ${error.message}`;
-            this.showError('Failed to execute code');
+        });
+    }
+    
+    async withLoadingButton(button, loadingText, doneText, action) {
+        button.disabled = true;
+        button.textContent = loadingText;
+        
+        try {
+            return await action();
         } finally {
-            this.executeBtn.disabled = false;
-            this.executeBtn.textContent = 'Execute Code';
+            button.disabled = false;
+            button.textContent = doneText;
         }
     }
     
@@ -468,16 +524,29 @@ class VoiceClient {
         
         const timestampDiv = document.createElement('div');
         timestampDiv.className = 'timestamp';
-        timestampDiv.textContent = new Date().toLocaleTimeString();
+        timestampDiv.textContent = MESSAGE_TIME_FORMAT.format(new Date());
         messageDiv.appendChild(timestampDiv);
         
         this.conversationArea.appendChild(messageDiv);
-        this.conversationArea.scrollTop = this.conversationArea.scrollHeight;
+        this.pinConversationScroll();
         
         this.stats.messagesCount++;
         this.updateStats();
     }
     
+    pinConversationScroll() {
+        // Coalesce scroll writes to one per frame; reading scrollHeight forces layout
+        if (this.scrollPending) return;
+        this.scrollPending = true;
+        
+        requestAnimationFrame(() => {
+            this.scrollPending = false;
+            if (this.followConversation) {
+                this.conversationArea.scrollTop = this.conversationArea.scrollHeight;
+            }
+        });
+    }
+    
     updateAudioVisualizer(audioData) {
         if (!this.audioBars) return;
         
@@ -577,17 +646,12 @@ class VoiceClient {
         return output;
     }
     
-    arrayBufferToHex(buffer) {
-        const bytes = new Uint8Array(buffer);
-        return Array.from(bytes, byte => byte.toString(16).padStart(2, '0')).join('');
-    }
-    
     async playAudioResponse(audioData) {
         try {
             this.updateStatus('speaking', 'Speaking...');
             
-            // Convert hex string back to audio data
-            const bytes = new Uint8Array(audioData.match(/.{1,2}/g).map(byte => parseInt(byte, 16)));
+            // Decode base64 audio payload
+            const bytes = Uint8Array.from(atob(audioData), char => char.charCodeAt(0));
             
             // Create audio buffer and play
             const audioBuffer = await this.audioContext.decodeAudioData(bytes.buffer);
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """Simple test for the execute endpoint."""
 
+import logging
+import sys
+
 import requests
-import json
+
+SESSION = requests.Session()
+
+logger = logging.getLogger(__name__)
 
 def test_execute_endpoint():
     """Test the Python code execution endpoint."""
@@ -23,11 +29,15 @@ print(f'Sum of {numbers} = {total}')
     }
     
     try:
-        response = requests.post(url, json=payload)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
+        response = SESSION.post(url, json=payload)
+    except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
+        raise
+    
+    print(f"Status Code: {response.status_code}")
+    assert response.status_code == 200, response.text
+    logger.debug("Response: %s", response.json())
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.INFO, format="%(message)s")
     test_execute_endpoint()
\ No newline at end of file
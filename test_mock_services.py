@@ -1,91 +1,114 @@
 #!/usr/bin/env python3
 """Test the mock services endpoints."""
 
-import requests
+import asyncio
 import json
+import logging
+import sys
 
-def test_sentiment_analysis():
-    """Test sentiment analysis endpoint."""
-    print("=== Testing Sentiment Analysis ===")
-    url = "http://localhost:9090/api/sentiment"
-    
-    payload = {
-        "text": "I love using this ADK-MCP server! It's working great."
-    }
-    
-    try:
-        response = requests.post(url, json=payload)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-def test_translation():
-    """Test translation endpoint."""
-    print("\n=== Testing Translation ===")
-    url = "http://localhost:9090/api/translate"
-    
-    payload = {
-        "text": "Hello, how are you?",
-        "target_language": "es",
-        "source_language": "en"
-    }
-    
-    try:
-        response = requests.post(url, json=payload)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-def test_text_generation():
-    """Test text generation endpoint."""
-    print("\n=== Testing Text Generation ===")
-    url = "http://localhost:9090/api/generate"
-    
-    payload = {
-        "prompt": "Explain Android development in simple terms",
-        "max_tokens": 150,
-        "temperature": 0.7
-    }
-    
-    try:
-        response = requests.post(url, json=payload)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-def test_adk_session_management():
-    """Test ADK session management."""
-    print("\n=== Testing ADK Session Management ===")
-    
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "http://localhost:9090"
+
+SENTIMENT_PAYLOAD = {
+    "text": "I love using this ADK-MCP server! It's working great."
+}
+TRANSLATE_PAYLOAD = {
+    "text": "Hello, how are you?",
+    "target_language": "es",
+    "source_language": "en"
+}
+GENERATE_PAYLOAD = {
+    "prompt": "Explain Android development in simple terms",
+    "max_tokens": 150,
+    "temperature": 0.7
+}
+SESSION_START_PAYLOAD = {"user_id": "test_user_123"}
+
+
+async def read_json(response: aiohttp.ClientResponse):
+    """Check for a 200 before decoding, so error pages fail on the status."""
+    body = await response.text()
+    assert response.status == 200, f"{response.status}: {body}"
+    return json.loads(body)
+
+
+async def check_sentiment_analysis(session: aiohttp.ClientSession):
+    """Check the sentiment analysis endpoint."""
+    url = f"{BASE_URL}/api/sentiment"
+
+    async with session.post(url, json=SENTIMENT_PAYLOAD) as response:
+        print("=== Testing Sentiment Analysis ===")
+        print(f"Status Code: {response.status}")
+        data = await read_json(response)
+        logger.debug("Response: %s", data)
+
+async def check_translation(session: aiohttp.ClientSession):
+    """Check the translation endpoint."""
+    url = f"{BASE_URL}/api/translate"
+
+    async with session.post(url, json=TRANSLATE_PAYLOAD) as response:
+        print("\n=== Testing Translation ===")
+        print(f"Status Code: {response.status}")
+        data = await read_json(response)
+        logger.debug("Response: %s", data)
+
+async def check_text_generation(session: aiohttp.ClientSession):
+    """Check the text generation endpoint."""
+    url = f"{BASE_URL}/api/generate"
+
+    async with session.post(url, json=GENERATE_PAYLOAD) as response:
+        print("\n=== Testing Text Generation ===")
+        print(f"Status Code: {response.status}")
+        data = await read_json(response)
+        logger.debug("Response: %s", data)
+
+async def check_adk_session_management(session: aiohttp.ClientSession):
+    """Check ADK session start and end."""
     # Start session
-    start_url = "http://localhost:9090/adk/session/start"
-    start_payload = {"user_id": "test_user_123"}
-    
-    try:
-        response = requests.post(start_url, json=start_payload)
-        print(f"Start Session - Status Code: {response.status_code}")
-        session_data = response.json()
-        print(f"Start Session Response: {json.dumps(session_data, indent=2)}")
-        
-        session_id = session_data.get("session_id")
-        
-        if session_id:
-            # End session
-            end_url = "http://localhost:9090/adk/session/end"
-            end_payload = {"session_id": session_id}
-            
-            response = requests.post(end_url, json=end_payload)
-            print(f"End Session - Status Code: {response.status_code}")
-            print(f"End Session Response: {json.dumps(response.json(), indent=2)}")
-        
-    except Exception as e:
-        print(f"Error: {e}")
+    start_url = f"{BASE_URL}/adk/session/start"
+
+    async with session.post(start_url, json=SESSION_START_PAYLOAD) as response:
+        print("\n=== Testing ADK Session Management ===")
+        print(f"Start Session - Status Code: {response.status}")
+        session_data = await read_json(response)
+        logger.debug("Start Session Response: %s", session_data)
+
+    session_id = session_data.get("session_id")
+
+    if session_id:
+        # End session
+        end_url = f"{BASE_URL}/adk/session/end"
+        end_payload = {"session_id": session_id}
+
+        async with session.post(end_url, json=end_payload) as response:
+            print(f"End Session - Status Code: {response.status}")
+            end_data = await read_json(response)
+            logger.debug("End Session Response: %s", end_data)
+
+async def main() -> int:
+    """Exercise all endpoints concurrently; return the number of failed checks."""
+    checks = [
+        check_sentiment_analysis,
+        check_translation,
+        check_text_generation,
+        check_adk_session_management,
+    ]
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *(check(session) for check in checks),
+            return_exceptions=True,
+        )
+
+    failures = 0
+    for check, result in zip(checks, results):
+        if isinstance(result, BaseException):
+            failures += 1
+            print(f"{check.__name__} failed: {result!r}")
+    return failures
 
 if __name__ == "__main__":
-    test_sentiment_analysis()
-    test_translation()
-    test_text_generation()
-    test_adk_session_management()
\ No newline at end of file
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.INFO, format="%(message)s")
+    sys.exit(1 if asyncio.run(main()) else 0)
@@ -1,40 +1,63 @@
 #!/usr/bin/env python3
 """Test the real Google ADK-Web integration."""
 
+import logging
+import socket
+import sys
+
 import requests
-import json
+
+SESSION = requests.Session()
+
+logger = logging.getLogger(__name__)
+
+SERVER_ADDRESS = ("localhost", 9090)
+# Fail fast when the server is down, but give Vertex AI time to answer
+TIMEOUT = (2, 30)
+
+CHAT_PAYLOAD = {
+    "message": "Hello! Can you explain what Android development is in simple terms?"
+}
+SESSION_START_PAYLOAD = {"user_id": "real_test_user"}
+
+def server_reachable() -> bool:
+    """Probe the server port so a stopped server is reported at once."""
+    try:
+        with socket.create_connection(SERVER_ADDRESS, timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+def post(url: str, payload: dict) -> requests.Response:
+    """POST JSON to the server, reporting transport errors before re-raising."""
+    try:
+        return SESSION.post(url, json=payload, timeout=TIMEOUT)
+    except requests.exceptions.Timeout:
+        print("Request timed out - this might indicate the real API is being called")
+        raise
+    except requests.exceptions.RequestException as e:
+        print(f"Error: {e}")
+        raise
 
 def test_google_adk_chat():
     """Test the Google ADK-Web chat endpoint with real Vertex AI."""
     print("=== Testing Google ADK-Web Chat (Real Vertex AI) ===")
     url = "http://localhost:9090/adk/chat"
     
-    payload = {
-        "message": "Hello! Can you explain what Android development is in simple terms?"
-    }
+    print("Sending request to Google ADK-Web...")
+    response = post(url, CHAT_PAYLOAD)
+    print(f"Status Code: {response.status_code}")
+    assert response.status_code == 200, response.text
     
-    try:
-        print("Sending request to Google ADK-Web...")
-        response = requests.post(url, json=payload, timeout=30)
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            print(f"Response: {json.dumps(response_data, indent=2)}")
-            
-            # Check if it's a real response vs mock
-            content = response_data.get("content", "")
-            if "I'm having trouble generating a response right now" in content:
-                print("\n❌ Still getting mock response - Google Cloud may not be properly configured")
-            else:
-                print("\n✅ Real Google ADK-Web response received!")
-        else:
-            print(f"Error response: {response.text}")
-            
-    except requests.exceptions.Timeout:
-        print("Request timed out - this might indicate the real API is being called")
-    except Exception as e:
-        print(f"Error: {e}")
+    response_data = response.json()
+    logger.debug("Response: %s", response_data)
+    
+    # Check if it's a real response vs mock
+    content = response_data.get("content", "")
+    if "I'm having trouble generating a response right now" in content:
+        print("\n❌ Still getting mock response - Google Cloud may not be properly configured")
+    else:
+        print("\n✅ Real Google ADK-Web response received!")
 
 def test_google_adk_with_session():
     """Test Google ADK-Web with session management."""
@@ -42,41 +65,39 @@ def test_google_adk_with_session():
     
     # Start session
     start_url = "http://localhost:9090/adk/session/start"
-    start_payload = {"user_id": "real_test_user"}
     
-    try:
-        response = requests.post(start_url, json=start_payload)
-        print(f"Start Session - Status Code: {response.status_code}")
-        session_data = response.json()
-        session_id = session_data.get("session_id")
-        print(f"Session ID: {session_id}")
-        
-        if session_id:
-            # Send chat message with session
-            chat_url = "http://localhost:9090/adk/chat"
-            chat_payload = {
-                "message": "What are the key components of an Android app?",
-                "session_id": session_id
-            }
-            
-            print("\nSending chat message with session...")
-            response = requests.post(chat_url, json=chat_payload, timeout=30)
-            print(f"Chat Response - Status Code: {response.status_code}")
-            
-            if response.status_code == 200:
-                chat_data = response.json()
-                print(f"Chat Response: {json.dumps(chat_data, indent=2)}")
-            
-            # End session
-            end_url = "http://localhost:9090/adk/session/end"
-            end_payload = {"session_id": session_id}
-            
-            response = requests.post(end_url, json=end_payload)
-            print(f"\nEnd Session - Status Code: {response.status_code}")
-        
-    except Exception as e:
-        print(f"Error: {e}")
+    response = post(start_url, SESSION_START_PAYLOAD)
+    print(f"Start Session - Status Code: {response.status_code}")
+    assert response.status_code == 200, response.text
+    session_id = response.json().get("session_id")
+    print(f"Session ID: {session_id}")
+    assert session_id, "start session response has no session_id"
+    
+    # Send chat message with session
+    chat_url = "http://localhost:9090/adk/chat"
+    chat_payload = {
+        "message": "What are the key components of an Android app?",
+        "session_id": session_id
+    }
+    
+    print("\nSending chat message with session...")
+    response = post(chat_url, chat_payload)
+    print(f"Chat Response - Status Code: {response.status_code}")
+    assert response.status_code == 200, response.text
+    logger.debug("Chat Response: %s", response.json())
+    
+    # End session
+    end_url = "http://localhost:9090/adk/session/end"
+    end_payload = {"session_id": session_id}
+    
+    response = post(end_url, end_payload)
+    print(f"\nEnd Session - Status Code: {response.status_code}")
+    assert response.status_code == 200, response.text
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.INFO, format="%(message)s")
+    if not server_reachable():
+        print("Server not running on %s:%d, skipping" % SERVER_ADDRESS)
+        sys.exit(0)
     test_google_adk_chat()
     test_google_adk_with_session()
\ No newline at end of file
@@ -1,9 +1,26 @@
 #!/usr/bin/env python3
 """Simple test to check Vertex AI API status."""
 
+import functools
+import itertools
 import os
 from google.auth import default
 
+_aiplatform_initialized = False
+
+
+@functools.lru_cache(maxsize=1)
+def _credentials():
+    """Load application default credentials once."""
+    return default()
+
+
+@functools.lru_cache(maxsize=1)
+def _model_client():
+    """Create the Vertex AI model client (and its channel) once."""
+    from google.cloud import aiplatform_v1
+    return aiplatform_v1.ModelServiceClient()
+
 def check_api_access():
     """Check if we can access Vertex AI APIs."""
     
@@ -15,13 +32,13 @@ def check_api_access():
     
     try:
         # Test basic authentication
-        credentials, project = default()
+        credentials, project = _credentials()
         print(f"✅ Authentication: {project}")
         
         # Test Vertex AI client creation
         from google.cloud import aiplatform_v1
         
-        client = aiplatform_v1.ModelServiceClient()
+        client = _model_client()
         print("✅ Vertex AI client created")
         
         # Try to make a simple API call
@@ -37,10 +54,12 @@ def check_api_access():
         
         print("✅ API call successful!")
         
-        models = list(response)
-        print(f"Found {len(models)} models")
+        # The first page is enough to show a few models; don't fetch the rest
+        first_page = next(iter(response.pages), None)
+        models = first_page.models if first_page is not None else []
+        print(f"Found {len(models)} models on the first page")
         
-        for i, model in enumerate(models[:3]):  # Show first 3
+        for i, model in enumerate(itertools.islice(models, 3)):  # Show first 3
             print(f"  {i+1}. {model.display_name} ({model.name})")
             
         return True
@@ -61,16 +80,19 @@ def check_api_access():
 
 def test_alternative_approach():
     """Test if we can use the legacy AI Platform."""
+    global _aiplatform_initialized
     print("\n=== Testing Legacy AI Platform ===")
     
     try:
         from google.cloud import aiplatform
         
         # Try the old approach
-        aiplatform.init(
-            project='gen-lang-client-0652476115',
-            location='us-central1'
-        )
+        if not _aiplatform_initialized:
+            aiplatform.init(
+                project='gen-lang-client-0652476115',
+                location='us-central1'
+            )
+            _aiplatform_initialized = True
         
         print("✅ Legacy AI Platform initialized")
         
@@ -1,32 +1,49 @@
 #!/usr/bin/env python3
 """Test the streaming endpoint."""
 
-import requests
 import json
+import logging
+import sys
+
+import requests
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+SESSION = requests.Session()
+
+logger = logging.getLogger(__name__)
+
+STREAM_PAYLOAD = {
+    "message": "Tell me about Android development with streaming response"
+}
 
 def test_streaming_endpoint():
     """Test the streaming endpoint."""
     url = "http://localhost:9090/stream"
     
-    payload = {
-        "message": "Tell me about Android development with streaming response"
-    }
-    
     try:
-        response = requests.post(url, json=payload, stream=True)
-        print(f"Status Code: {response.status_code}")
-        print("Streaming response:")
-        
-        for line in response.iter_lines():
-            if line:
-                try:
-                    data = json.loads(line.decode('utf-8'))
-                    print(f"Chunk: {data}")
-                except json.JSONDecodeError:
-                    print(f"Raw line: {line.decode('utf-8')}")
-                    
-    except Exception as e:
+        response = SESSION.post(url, json=STREAM_PAYLOAD, stream=True)
+    except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
+        raise
+    
+    print(f"Status Code: {response.status_code}")
+    assert response.status_code == 200
+    print("Streaming response:")
+    
+    for line in response.iter_lines():
+        if line:
+            try:
+                # Both parsers accept the raw bytes, no per-line decode needed
+                data = _loads(line)
+                logger.debug("Chunk: %s", data)
+            except ValueError:
+                logger.debug("Raw line: %s", line)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv else logging.INFO, format="%(message)s")
     test_streaming_endpoint()
\ No newline at end of file
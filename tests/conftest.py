@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop where it is available."""
+    if UVLOOP_AVAILABLE:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
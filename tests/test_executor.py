@@ -5,6 +5,12 @@ import asyncio
 from adk_mcp.executor import PythonExecutor, SafePythonExecutor
 
 
+@pytest.fixture(scope="module")
+def safe_exec():
+    """Safe executor shared by the module so its blocklist is built once."""
+    return SafePythonExecutor(timeout=10, enable_safety_checks=True)
+
+
 @pytest.mark.asyncio
 async def test_simple_execution():
     """Test executing simple Python code."""
@@ -64,29 +70,25 @@ print("Should not reach here")
 
 
 @pytest.mark.asyncio
-async def test_safe_executor_blocks_dangerous_code():
+async def test_safe_executor_blocks_dangerous_code(safe_exec):
     """Test that safe executor blocks dangerous patterns."""
-    executor = SafePythonExecutor(timeout=10, enable_safety_checks=True)
-    
     # Test blocking imports
     code = "import os"
-    result = await executor.execute(code)
+    result = await safe_exec.execute(code)
     
     assert not result.success
     assert "blocked pattern" in result.error
 
 
 @pytest.mark.asyncio
-async def test_safe_executor_allows_safe_code():
+async def test_safe_executor_allows_safe_code(safe_exec):
     """Test that safe executor allows safe code."""
-    executor = SafePythonExecutor(timeout=10, enable_safety_checks=True)
-    
     code = """
 x = [1, 2, 3, 4, 5]
 total = sum(x)
 print(f"Total: {total}")
 """
-    result = await executor.execute(code)
+    result = await safe_exec.execute(code)
     
     assert result.success
     assert "Total: 15" in result.output
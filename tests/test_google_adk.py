@@ -83,7 +83,7 @@ class TestConversationContext:
 class TestGoogleADKWebAgent:
     """Test Google ADK-Web agent."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def config(self):
         """Create test config."""
         return ADKWebConfig(
@@ -91,11 +91,18 @@ class TestGoogleADKWebAgent:
             model_name="gemini-1.5-pro"
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def agent(self, config):
-        """Create test agent."""
+        """Create test agent shared by the class."""
         return GoogleADKWebAgent(config)
     
+    @pytest.fixture(autouse=True)
+    def _reset_agent(self, agent):
+        """Give each test a clean agent."""
+        agent.active_sessions.clear()
+        agent._model = None
+        yield
+    
     def test_agent_creation(self, agent, config):
         """Test agent creation."""
         assert agent.config == config
@@ -172,17 +179,23 @@ class TestGoogleADKWebAgent:
 class TestADKWebStreamHandler:
     """Test ADK-Web stream handler."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def agent(self):
-        """Create test agent."""
+        """Create test agent shared by the class."""
         config = ADKWebConfig(project_id="test-project")
         return GoogleADKWebAgent(config)
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def handler(self, agent):
-        """Create test handler."""
+        """Create test handler shared by the class."""
         return ADKWebStreamHandler(agent)
     
+    @pytest.fixture(autouse=True)
+    def _reset_agent(self, agent):
+        """Give each test a clean agent."""
+        agent.active_sessions.clear()
+        yield
+    
     @pytest.mark.asyncio
     async def test_handle_text_message(self, handler):
         """Test handling text messages."""
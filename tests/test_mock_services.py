@@ -4,11 +4,15 @@ import pytest
 from adk_mcp.mock_services import MockGoogleCloudServices
 
 
+@pytest.fixture(scope="module")
+def services():
+    """Mock services shared by the tests that don't inspect request history."""
+    return MockGoogleCloudServices()
+
+
 @pytest.mark.asyncio
-async def test_sentiment_analysis():
+async def test_sentiment_analysis(services):
     """Test mock sentiment analysis."""
-    services = MockGoogleCloudServices()
-    
     result = await services.analyze_sentiment("This is a great day!")
     
     assert result.sentiment_score is not None
@@ -18,32 +22,20 @@ async def test_sentiment_analysis():
 
 
 @pytest.mark.asyncio
-async def test_sentiment_positive():
-    """Test sentiment analysis with positive text."""
-    services = MockGoogleCloudServices()
-    
-    result = await services.analyze_sentiment("This is amazing and wonderful!")
+@pytest.mark.parametrize("text,expected_sign", [
+    ("This is amazing and wonderful!", 1),
+    ("This is terrible and awful!", -1),
+])
+async def test_sentiment_polarity(services, text, expected_sign):
+    """Test sentiment analysis picks up positive and negative text."""
+    result = await services.analyze_sentiment(text)
     
-    # Should have positive sentiment
-    assert result.sentiment_score > 0
+    assert result.sentiment_score * expected_sign > 0
 
 
 @pytest.mark.asyncio
-async def test_sentiment_negative():
-    """Test sentiment analysis with negative text."""
-    services = MockGoogleCloudServices()
-    
-    result = await services.analyze_sentiment("This is terrible and awful!")
-    
-    # Should have negative sentiment
-    assert result.sentiment_score < 0
-
-
-@pytest.mark.asyncio
-async def test_translation():
+async def test_translation(services):
     """Test mock text translation."""
-    services = MockGoogleCloudServices()
-    
     result = await services.translate_text(
         "Hello world",
         target_language="es"
@@ -55,10 +47,8 @@ async def test_translation():
 
 
 @pytest.mark.asyncio
-async def test_text_generation():
+async def test_text_generation(services):
     """Test mock text generation."""
-    services = MockGoogleCloudServices()
-    
     result = await services.generate_text(
         "Write a story about",
         max_tokens=50
@@ -70,10 +60,8 @@ async def test_text_generation():
 
 
 @pytest.mark.asyncio
-async def test_speech_to_text():
+async def test_speech_to_text(services):
     """Test mock speech-to-text."""
-    services = MockGoogleCloudServices()
-    
     audio_data = b"fake audio data"
     result = await services.speech_to_text(audio_data)
     
@@ -83,24 +71,23 @@ async def test_speech_to_text():
 
 
 @pytest.mark.asyncio
-async def test_text_to_speech():
+async def test_text_to_speech(services):
     """Test mock text-to-speech."""
-    services = MockGoogleCloudServices()
-    
     audio = await services.text_to_speech("Hello world")
     
     assert isinstance(audio, bytes)
     assert len(audio) > 0
 
 
-def test_request_history():
+@pytest.mark.asyncio
+async def test_request_history():
     """Test request history tracking."""
+    # Own instance: the shared fixture's history includes other tests' requests
     services = MockGoogleCloudServices()
     
     # Make some requests
-    import asyncio
-    asyncio.run(services.analyze_sentiment("Test"))
-    asyncio.run(services.translate_text("Test", "es"))
+    await services.analyze_sentiment("Test")
+    await services.translate_text("Test", "es")
     
     history = services.get_request_history()
     assert len(history) == 2
@@ -74,10 +74,7 @@ async def test_stream_send_receive():
         )
         stream.simulate_receive(receive_message)
         
-        # Wait a bit for async processing
-        await asyncio.sleep(0.2)
-        
-        # Receive the message
+        # Receive the message as soon as it is queued
         received = await asyncio.wait_for(stream.receive(), timeout=1.0)
         assert received.id == "recv-1"
         assert received.content == "Response"
@@ -120,7 +117,7 @@ async def test_stream_handler_async():
     handled_messages = []
     
     async def async_handler(message: StreamMessage):
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0)
         handled_messages.append(message)
         return None
     